@@ -42,7 +42,8 @@ try:
         year=2024,
         output_dir="wrapped_output",
         snowflake_config=snowflake_config,
-        include_audio=True
+        include_audio=True,
+        max_workers=4  # Generate up to 4 users concurrently
     )
     print(f"Generated {len(output_files)} wrapped visualizations")
 except Exception as e:
@@ -3,12 +3,15 @@ Compare data between objectdownload_event and FILEDOWNLOAD tables.
 """
 
 import sys
+import time
 import tomllib
 from pathlib import Path
 
+import pandas as pd
+
 sys.path.insert(0, '..')
 
-from synapse_wrapped.utils import get_data_from_snowflake
+from synapse_wrapped.utils import connect_to_snowflake, get_data_from_snowflake
 
 # Load Snowflake config from parent's secrets.toml
 SECRETS_PATH = Path('..') / '.streamlit' / 'secrets.toml'
@@ -18,80 +21,110 @@ with open(SECRETS_PATH, 'rb') as f:
 
 TEST_USER_ID = 3514384
 YEAR = 2025
+# Longest schema listing to print in full; longer ones are truncated by pandas
+MAX_SCHEMA_ROWS = 200
+
+# Table structures rarely change, so the schema listing is cached on disk for a week
+SCHEMA_CACHE_PATH = Path.home() / '.cache' / 'synapse_wrapped' / 'schemas.json'
+SCHEMA_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# Both table structures in one round trip
+SCHEMA_QUERY = """
+SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE
+FROM SYNAPSE_DATA_WAREHOUSE.INFORMATION_SCHEMA.COLUMNS
+WHERE (TABLE_SCHEMA = 'SYNAPSE_EVENT' AND TABLE_NAME = 'OBJECTDOWNLOAD_EVENT')
+   OR (TABLE_SCHEMA = 'SYNAPSE' AND TABLE_NAME = 'FILEDOWNLOAD')
+ORDER BY TABLE_NAME, ORDINAL_POSITION
+"""
+
+def get_table_schemas(session):
+    """Return the column listing of both tables, from the disk cache when it is fresh."""
+    try:
+        if time.time() - SCHEMA_CACHE_PATH.stat().st_mtime < SCHEMA_CACHE_MAX_AGE:
+            return pd.read_json(SCHEMA_CACHE_PATH, orient='records', dtype=str)
+    except (OSError, ValueError):
+        pass  # No usable cache; query INFORMATION_SCHEMA below
+
+    schema = get_data_from_snowflake(SCHEMA_QUERY, session=session)
+    SCHEMA_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    schema.to_json(SCHEMA_CACHE_PATH, orient='records')
+    return schema
 
 def compare_tables():
-    # Query 1: objectdownload_event (synapse_wrapped uses this)
-    query_event = f"""
+    # Both summaries in one round trip: objectdownload_event (synapse_wrapped
+    # uses this) and FILEDOWNLOAD (parent implementation uses this)
+    query_summary = """
     SELECT
+        'objectdownload_event' AS source,
         COUNT(DISTINCT file_handle_id) AS file_count,
         COUNT(DISTINCT project_id) AS project_count,
         COUNT(DISTINCT DATE(record_date)) AS active_days,
         MIN(record_date) AS first_activity,
         MAX(record_date) AS last_activity
     FROM synapse_data_warehouse.synapse_event.objectdownload_event
-    WHERE user_id = {TEST_USER_ID}
-        AND record_date BETWEEN '{YEAR}-01-01' AND '{YEAR}-12-31'
-    """
-
-    # Query 2: FILEDOWNLOAD (parent implementation uses this)
-    query_filedownload = f"""
+    WHERE user_id = ?
+        AND record_date BETWEEN ? AND ?
+    UNION ALL
     SELECT
+        'filedownload' AS source,
         COUNT(DISTINCT FILE_HANDLE_ID) AS file_count,
         COUNT(DISTINCT PROJECT_ID) AS project_count,
         COUNT(DISTINCT DATE(TIMESTAMP)) AS active_days,
         MIN(TIMESTAMP) AS first_activity,
         MAX(TIMESTAMP) AS last_activity
     FROM SYNAPSE_DATA_WAREHOUSE.SYNAPSE.FILEDOWNLOAD
-    WHERE USER_ID = {TEST_USER_ID}
-        AND RECORD_DATE >= '{YEAR}-01-01'
-        AND RECORD_DATE < '{YEAR + 1}-01-01'
+    WHERE USER_ID = ?
+        AND RECORD_DATE >= ?
+        AND RECORD_DATE < ?
     """
+    # Bind values (in "?" order) instead of formatting them into the SQL
+    summary_params = [
+        TEST_USER_ID, f'{YEAR}-01-01', f'{YEAR}-12-31',
+        TEST_USER_ID, f'{YEAR}-01-01', f'{YEAR + 1}-01-01',
+    ]
 
     print("Comparing objectdownload_event vs FILEDOWNLOAD tables\n")
     print("="*60)
 
     try:
+        # Open the session once and run every query on it
+        session = connect_to_snowflake(SNOWFLAKE_CONFIG)
+        summary = get_data_from_snowflake(query_summary, session=session, params=summary_params)
+        df_event = summary[summary['SOURCE'] == 'objectdownload_event'].drop(columns='SOURCE').reset_index(drop=True)
+        df_filedownload = summary[summary['SOURCE'] == 'filedownload'].drop(columns='SOURCE').reset_index(drop=True)
+
         print("\n1. Testing objectdownload_event table...")
-        df_event = get_data_from_snowflake(query_event, SNOWFLAKE_CONFIG)
         print("✓ Query successful")
         print(df_event.to_string())
 
         print("\n2. Testing FILEDOWNLOAD table...")
-        df_filedownload = get_data_from_snowflake(query_filedownload, SNOWFLAKE_CONFIG)
         print("✓ Query successful")
         print(df_filedownload.to_string())
 
         print("\n3. Comparison:")
         print("-" * 60)
-        for col in ['FILE_COUNT', 'PROJECT_COUNT', 'ACTIVE_DAYS']:
-            val1 = df_event.iloc[0][col]
-            val2 = df_filedownload.iloc[0][col]
-            diff = val2 - val1
-            pct = (diff / val1 * 100) if val1 > 0 else 0
-            match = "✓" if abs(pct) < 5 else "⚠"
-            print(f"{match} {col:20s}: event={val1:8d} | filedownload={val2:8d} | diff={diff:+8d} ({pct:+.1f}%)")
+        # Compute every metric's difference at once; 0% where the event count is 0
+        metrics = ['FILE_COUNT', 'PROJECT_COUNT', 'ACTIVE_DAYS']
+        event = df_event.iloc[0][metrics].astype(int)
+        filedownload = df_filedownload.iloc[0][metrics].astype(int)
+        diff = filedownload - event
+        pct = (diff / event.where(event > 0) * 100).fillna(0)
+        for col in metrics:
+            match = "✓" if abs(pct[col]) < 5 else "⚠"
+            print(f"{match} {col:20s}: event={event[col]:8d} | filedownload={filedownload[col]:8d} | diff={diff[col]:+8d} ({pct[col]:+.1f}%)")
 
         print("\n4. Schema comparison:")
         print("-" * 60)
+        schema = get_table_schemas(session)
+        schema_columns = ['COLUMN_NAME', 'DATA_TYPE']
+
         print("objectdownload_event table structure:")
-        schema_event = get_data_from_snowflake("""
-            SELECT COLUMN_NAME, DATA_TYPE
-            FROM SYNAPSE_DATA_WAREHOUSE.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'SYNAPSE_EVENT'
-              AND TABLE_NAME = 'OBJECTDOWNLOAD_EVENT'
-            ORDER BY ORDINAL_POSITION
-        """, SNOWFLAKE_CONFIG)
-        print(schema_event.to_string())
+        schema_event = schema.loc[schema['TABLE_NAME'] == 'OBJECTDOWNLOAD_EVENT', schema_columns].reset_index(drop=True)
+        print(schema_event.to_string(max_rows=MAX_SCHEMA_ROWS))
 
         print("\nFILEDOWNLOAD table structure:")
-        schema_filedownload = get_data_from_snowflake("""
-            SELECT COLUMN_NAME, DATA_TYPE
-            FROM SYNAPSE_DATA_WAREHOUSE.INFORMATION_SCHEMA.COLUMNS
-            WHERE TABLE_SCHEMA = 'SYNAPSE'
-              AND TABLE_NAME = 'FILEDOWNLOAD'
-            ORDER BY ORDINAL_POSITION
-        """, SNOWFLAKE_CONFIG)
-        print(schema_filedownload.to_string())
+        schema_filedownload = schema.loc[schema['TABLE_NAME'] == 'FILEDOWNLOAD', schema_columns].reset_index(drop=True)
+        print(schema_filedownload.to_string(max_rows=MAX_SCHEMA_ROWS))
 
     except Exception as e:
         print(f"✗ Error: {e}")
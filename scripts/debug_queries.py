@@ -4,7 +4,7 @@ Debug script to check what data is being returned from queries.
 
 from datetime import datetime
 from synapse_wrapped.queries import *
-from synapse_wrapped.utils import get_data_from_snowflake
+from synapse_wrapped.utils import get_data_from_snowflake_batches
 
 year = 2025
 start_date = f"{year}-01-01"
@@ -30,12 +30,19 @@ for name, query in queries_to_test:
     print(f"\n{name}:")
     print("-" * 40)
     try:
-        df = get_data_from_snowflake(query)
-        print(f"Rows returned: {len(df)}")
-        if not df.empty:
-            print(f"Columns: {list(df.columns)}")
+        # Stream the result: only the row count and the first rows are needed,
+        # so large results (e.g. the collaboration network) aren't held in memory
+        row_count = 0
+        head = None
+        for batch in get_data_from_snowflake_batches(query):
+            if head is None and not batch.empty:
+                head = batch.head()
+            row_count += len(batch)
+        print(f"Rows returned: {row_count}")
+        if head is not None:
+            print(f"Columns: {list(head.columns)}")
             print(f"First few rows:")
-            print(df.head())
+            print(head)
         else:
             print("⚠️  Empty result!")
     except Exception as e:
@@ -4,7 +4,14 @@ Synapse Wrapped - Generate Spotify Wrapped-style visualizations for Synapse.org
 
 __version__ = "0.1.0"
 
-from synapse_wrapped.generator import generate_wrapped, generate_wrapped_batch
-
 __all__ = ["generate_wrapped", "generate_wrapped_batch"]
 
+
+def __getattr__(name):
+    # Import the generator (and with it pandas/Snowpark) on first use, so that
+    # importing the package or running `cli --help` stays fast
+    if name in __all__:
+        from synapse_wrapped import generator
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
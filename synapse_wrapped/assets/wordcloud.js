@@ -0,0 +1,69 @@
+// Word cloud slide. Reads the word list (text, size, color) that the
+// generator embeds as wordCloudData just before this script.
+(function() {
+    const data = wordCloudData;
+    const width = 1000;
+    const height = 500;
+
+    // Scale for font sizes
+    const maxSize = data[0].size;
+    const minSize = data[data.length - 1].size;
+    const sizeScale = d3.scaleLinear()
+        .domain([minSize, maxSize])
+        .range([20, 80]);
+
+    const layout = d3.layout.cloud()
+        .size([width, height])
+        .words(data.map(d => ({
+            text: d.text,
+            size: sizeScale(d.size),
+            color: d.color
+        })))
+        .padding(5)
+        .rotate(() => ~~(Math.random() * 2) * 90)  // 0 or 90 degrees
+        .font("Orbitron, sans-serif")
+        .fontSize(d => d.size)
+        .on("end", draw);
+
+    layout.start();
+
+    function draw(words) {
+        const svg = d3.select("#wordcloud-container")
+            .append("svg")
+            .attr("width", width)
+            .attr("height", height)
+            .append("g")
+            .attr("transform", "translate(" + width / 2 + "," + height / 2 + ")");
+
+        const text = svg.selectAll("text")
+            .data(words)
+            .enter().append("text")
+            .style("font-size", d => d.size + "px")
+            .style("font-family", "Orbitron, sans-serif")
+            .style("font-weight", "600")
+            .style("fill", d => d.color)
+            .attr("text-anchor", "middle")
+            .attr("transform", d => "translate(" + [d.x, d.y] + ")rotate(" + d.rotate + ")")
+            .text(d => d.text)
+            .style("cursor", "pointer")
+            .on("mouseover", function(event, d) {
+                d3.select(this)
+                    .transition()
+                    .duration(200)
+                    .style("font-size", (d.size * 1.3) + "px")
+                    .style("filter", "drop-shadow(0 0 8px " + d.color + ")");
+            })
+            .on("mouseout", function(event, d) {
+                d3.select(this)
+                    .transition()
+                    .duration(200)
+                    .style("font-size", d.size + "px")
+                    .style("filter", "none");
+            })
+            .append("title")
+            .text(d => {
+                const wordData = data.find(w => w.text.toLowerCase() === d.text.toLowerCase());
+                return wordData ? wordData.size + " occurrence" + (wordData.size > 1 ? "s" : "") : "";
+            });
+    }
+})();
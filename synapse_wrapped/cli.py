@@ -3,18 +3,17 @@ Command-line interface for Synapse Wrapped.
 """
 
 import argparse
+import json
 import sys
+import traceback
 from pathlib import Path
 from typing import List
 
-from synapse_wrapped import generate_wrapped, generate_wrapped_batch
-
 
 def read_usernames_from_file(file_path: str) -> List[str]:
     """Read usernames from a text file (one per line)."""
-    with open(file_path, 'r') as f:
-        usernames = [line.strip() for line in f if line.strip()]
-    return usernames
+    lines = map(str.strip, Path(file_path).read_text().splitlines())
+    return [line for line in lines if line]
 
 
 def main():
@@ -65,6 +64,37 @@ def main():
         help="Timezone for hourly activity charts (default: America/Chicago). Examples: America/New_York, America/Los_Angeles, Europe/London, UTC"
     )
     
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=10,
+        help="Number of users to generate concurrently in batch mode (default: 10)"
+    )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="In batch mode, regenerate users whose output file already exists"
+    )
+    
+    parser.add_argument(
+        "--external-css",
+        action="store_true",
+        help="Write a shared wrapped.css next to the output and link to it instead of inlining styles"
+    )
+    
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Also write a precompressed .html.gz copy of each report for web hosting"
+    )
+    
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print full tracebacks on errors"
+    )
+    
     args = parser.parse_args()
     
     # Validate arguments
@@ -74,24 +104,33 @@ def main():
     if args.username and args.batch:
         parser.error("Cannot specify both --username and --batch")
     
+    # Deferred so --help and argument errors don't pay for pandas/Snowpark imports
+    from synapse_wrapped import generate_wrapped, generate_wrapped_batch
+    
     # Load Snowflake config if provided
     snowflake_config = None
     if args.config:
-        import json
         with open(args.config, 'r') as f:
             snowflake_config = json.load(f)
     
+    # Options shared by the single-user and batch paths
+    common_kwargs = {
+        "year": args.year,
+        "snowflake_config": snowflake_config,
+        "include_audio": not args.no_audio,
+        "timezone": args.timezone,
+        "external_css": args.external_css,
+        "precompress": args.gzip,
+    }
+    
     # Generate wrapped
     try:
         if args.username:
             # Single user
             output_path = generate_wrapped(
                 username=args.username,
-                year=args.year,
                 output_path=args.output,
-                snowflake_config=snowflake_config,
-                include_audio=not args.no_audio,
-                timezone=args.timezone
+                **common_kwargs
             )
             print(f"✓ Generated wrapped for {args.username}: {output_path}")
         
@@ -108,10 +147,10 @@ def main():
             
             output_files = generate_wrapped_batch(
                 usernames=usernames,
-                year=args.year,
                 output_dir=args.output,
-                snowflake_config=snowflake_config,
-                include_audio=not args.no_audio
+                max_workers=args.max_workers,
+                skip_existing=not args.force,
+                **common_kwargs
             )
             
             print(f"\n✓ Generated {len(output_files)} wrapped visualizations")
@@ -119,8 +158,8 @@ def main():
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        import traceback
-        traceback.print_exc()
+        if args.verbose:
+            traceback.print_exc()
         sys.exit(1)
 
 
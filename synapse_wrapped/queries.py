@@ -483,6 +483,77 @@ def query_user_average_file_size(user_id, start_date, end_date):
     """
 
 
+def query_user_download_summary(user_id, start_date, end_date, timezone='America/Chicago'):
+    """
+    Return the user's single-row download aggregates from one scan of their events.
+    
+    Combines the columns of query_user_files_downloaded, query_user_active_days,
+    query_user_time_patterns and query_user_average_file_size, so the event
+    table is read once instead of four times. file_latest is collapsed to one
+    row per file handle before the join, so COUNT(*) counts download events
+    even if a handle has several file_latest rows.
+    """
+    return f"""
+    WITH user_events AS (
+        SELECT
+            file_handle_id,
+            project_id,
+            record_date,
+            DATE_PART('hour', CONVERT_TIMEZONE('UTC', '{timezone}', timestamp)) AS hour_of_day,
+            DAYOFWEEK(CONVERT_TIMEZONE('UTC', '{timezone}', timestamp)) AS day_of_week
+        FROM
+            synapse_data_warehouse.synapse_event.objectdownload_event
+        WHERE
+            user_id = {user_id}
+            AND record_date BETWEEN '{start_date}' AND '{end_date}'
+    ),
+    file_sizes AS (
+        SELECT
+            id,
+            MAX(content_size) AS content_size
+        FROM
+            synapse_data_warehouse.synapse.file_latest
+        WHERE
+            id IN (SELECT file_handle_id FROM user_events)
+        GROUP BY
+            id
+    ),
+    user_downloads AS (
+        SELECT
+            ue.file_handle_id,
+            ue.project_id,
+            ue.record_date,
+            ue.hour_of_day,
+            ue.day_of_week,
+            fs.id AS file_id,
+            fs.content_size
+        FROM
+            user_events ue
+        LEFT JOIN
+            file_sizes fs
+        ON
+            fs.id = ue.file_handle_id
+    )
+    SELECT
+        -- Files downloaded (only files that have a file handle record)
+        COUNT(DISTINCT IFF(file_id IS NOT NULL, file_handle_id, NULL)) AS file_count,
+        SUM(content_size) AS total_size_bytes,
+        COUNT(DISTINCT IFF(file_id IS NOT NULL, project_id, NULL)) AS project_count,
+        -- Active days
+        COUNT(DISTINCT DATE(record_date)) AS active_days,
+        -- Time patterns
+        COUNT(*) AS total_downloads,
+        SUM(CASE WHEN hour_of_day >= 18 OR hour_of_day < 6 THEN 1 ELSE 0 END) AS night_downloads,
+        SUM(CASE WHEN hour_of_day >= 5 AND hour_of_day < 9 THEN 1 ELSE 0 END) AS early_downloads,
+        SUM(CASE WHEN day_of_week IN (0, 6) THEN 1 ELSE 0 END) AS weekend_downloads,
+        SUM(CASE WHEN day_of_week NOT IN (0, 6) THEN 1 ELSE 0 END) AS weekday_downloads,
+        -- Average file size (non-empty files only)
+        AVG(IFF(content_size > 0, content_size, NULL)) AS avg_file_size,
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY IFF(content_size > 0, content_size, NULL)) AS median_file_size
+    FROM user_downloads
+    """
+
+
 def query_user_monthly_download_size(user_id, start_date, end_date):
     """Return monthly download sizes for cumulative growth chart."""
     return f"""
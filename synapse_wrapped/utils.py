@@ -3,11 +3,30 @@ Utility functions for Synapse Wrapped.
 """
 
 from snowflake.snowpark import Session
-from typing import Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import threading
 import pandas as pd
 
 # Global session cache to reuse connections
 _session_cache = {}
+# Guards _session_cache so concurrent batch workers share one session per config
+_session_lock = threading.Lock()
+
+
+def _resolve_config(snowflake_config: Optional[Dict] = None) -> Dict:
+    """Return a copy of the connection config, falling back to streamlit secrets."""
+    if snowflake_config is None:
+        try:
+            # Try to use streamlit secrets if available
+            import streamlit as st
+            return dict(st.secrets.snowflake)
+        except (ImportError, AttributeError, KeyError):
+            raise ValueError(
+                "No Snowflake config provided and streamlit secrets not available. "
+                "Please provide snowflake_config parameter."
+            )
+    return dict(snowflake_config)  # Make a copy
 
 
 def connect_to_snowflake(snowflake_config: Optional[Dict] = None, cache_key: Optional[str] = None):
@@ -22,57 +41,49 @@ def connect_to_snowflake(snowflake_config: Optional[Dict] = None, cache_key: Opt
     Returns:
         Session: A Snowflake session object.
     """
-    # Create cache key
-    if cache_key is None:
-        if snowflake_config is None:
-            cache_key = "streamlit_secrets"
-        else:
-            # Create a simple hash from config values
-            cache_key = str(sorted(snowflake_config.items()))
-    
-    # Return cached session if available and still valid
-    if cache_key in _session_cache:
-        try:
-            session = _session_cache[cache_key]
-            # Test if session is still valid
-            session.sql("SELECT 1").collect()
-            return session
-        except:
-            # Session expired, remove from cache
-            del _session_cache[cache_key]
-    
-    # Create new session
-    if snowflake_config is None:
-        try:
-            # Try to use streamlit secrets if available
-            import streamlit as st
-            config = dict(st.secrets.snowflake)
-        except (ImportError, AttributeError, KeyError):
-            raise ValueError(
-                "No Snowflake config provided and streamlit secrets not available. "
-                "Please provide snowflake_config parameter."
-            )
-    else:
-        config = dict(snowflake_config)  # Make a copy
-    
-    # Ensure we're using the cached token from keyring
-    # The keyring package should automatically cache and reuse the SSO token
-    # when authenticator="externalbrowser" is set. The token is cached per
-    # (account, user) combination and typically lasts 4 hours.
-    # 
-    # Note: If you're still being prompted every time, it might be because:
-    # 1. The token expired (tokens last ~4 hours)
-    # 2. The keyring backend needs configuration
-    # 3. The account/user combination changed
-    session = Session.builder.configs(config).create()
-    
-    # Cache the session
-    _session_cache[cache_key] = session
-    
-    return session
+    with _session_lock:
+        # Create cache key
+        if cache_key is None:
+            if snowflake_config is None:
+                cache_key = "streamlit_secrets"
+            else:
+                # Create a simple hash from config values
+                cache_key = str(sorted(snowflake_config.items()))
+        
+        # Return cached session if available and still valid
+        if cache_key in _session_cache:
+            try:
+                session = _session_cache[cache_key]
+                # Test if session is still valid
+                session.sql("SELECT 1").collect()
+                return session
+            except:
+                # Session expired, remove from cache
+                del _session_cache[cache_key]
+        
+        # Create new session
+        config = _resolve_config(snowflake_config)
+        
+        # Ensure we're using the cached token from keyring
+        # The keyring package should automatically cache and reuse the SSO token
+        # when authenticator="externalbrowser" is set. The token is cached per
+        # (account, user) combination and typically lasts 4 hours.
+        # 
+        # Note: If you're still being prompted every time, it might be because:
+        # 1. The token expired (tokens last ~4 hours)
+        # 2. The keyring backend needs configuration
+        # 3. The account/user combination changed
+        session = Session.builder.configs(config).create()
+        
+        # Cache the session
+        _session_cache[cache_key] = session
+        
+        return session
 
 
-def get_data_from_snowflake(query: str, snowflake_config: Optional[Dict] = None):
+def get_data_from_snowflake(query: str, snowflake_config: Optional[Dict] = None,
+                            session: Optional[Session] = None,
+                            params: Optional[Sequence[Any]] = None):
     """
     Retrieve data from Snowflake based on the provided SQL query.
     Uses cached sessions to avoid repeated authentication.
@@ -80,15 +91,215 @@ def get_data_from_snowflake(query: str, snowflake_config: Optional[Dict] = None)
     Args:
         query: SQL query string
         snowflake_config: Optional Snowflake connection config dict
+        session: Optional open session to run the query on. When given, the
+                 cache lookup (and its "SELECT 1" validity check) is skipped.
+        params: Optional values for "?" bind variables in the query. Bound
+                queries keep the same SQL text for every value, so Snowflake
+                can reuse the compiled plan and cached results.
     
     Returns:
         pandas.DataFrame: Query results as a DataFrame
     """
-    session = connect_to_snowflake(snowflake_config)
-    df = session.sql(query).to_pandas()
+    if session is None:
+        session = connect_to_snowflake(snowflake_config)
+    # params= only exists on newer Snowpark releases; leave it off unless used
+    if params is None:
+        df = session.sql(query).to_pandas()
+    else:
+        df = session.sql(query, params=params).to_pandas()
     return df
 
 
+def get_data_from_snowflake_async(queries: List[str], snowflake_config: Optional[Dict] = None,
+                                  session: Optional[Session] = None,
+                                  single_row: Sequence[bool] = ()) -> List[Any]:
+    """
+    Run several independent queries concurrently on one session.
+    
+    Every query is submitted as an asynchronous Snowflake job before any result
+    is collected, so the total wait is roughly that of the slowest query rather
+    than the sum of all of them.
+    
+    Args:
+        queries: SQL query strings
+        snowflake_config: Optional Snowflake connection config dict
+        session: Optional open session to run the queries on
+        single_row: Optional flags, in the same order as queries, marking
+                    queries that return at most one row (such as plain
+                    aggregates). Their rows are collected directly instead of
+                    being converted to a DataFrame.
+    
+    Returns:
+        list: Query results, in the same order as queries. Each is a
+              pandas.DataFrame, or for a single_row query a dict of its first
+              row keyed by lower-case column name ({} when there is no row).
+    """
+    if session is None:
+        session = connect_to_snowflake(snowflake_config)
+    single_row = list(single_row) + [False] * (len(queries) - len(single_row))
+    jobs = [
+        session.sql(query).collect(block=False) if one_row else session.sql(query).to_pandas(block=False)
+        for query, one_row in zip(queries, single_row)
+    ]
+    results = []
+    for job, one_row in zip(jobs, single_row):
+        result = job.result()
+        if one_row:
+            result = {name.lower(): value for name, value in result[0].as_dict().items()} if result else {}
+        results.append(result)
+    return results
+
+
+def get_data_from_snowflake_batches(query: str, snowflake_config: Optional[Dict] = None,
+                                    session: Optional[Session] = None) -> Iterator[pd.DataFrame]:
+    """
+    Stream the results of a query as a sequence of DataFrames.
+    
+    Rows are converted chunk by chunk as they arrive, so a large result set is
+    never held in memory all at once. Prefer get_data_from_snowflake for small,
+    aggregated results.
+    
+    Args:
+        query: SQL query string
+        snowflake_config: Optional Snowflake connection config dict
+        session: Optional open session to run the query on
+    
+    Yields:
+        pandas.DataFrame: Consecutive chunks of the query result
+    """
+    if session is None:
+        session = connect_to_snowflake(snowflake_config)
+    yield from session.sql(query).to_pandas_batches()
+
+
+def _session_is_alive(session: Session) -> bool:
+    """Whether a session can still run queries."""
+    try:
+        session.sql("SELECT 1").collect()
+    except Exception:
+        return False
+    return True
+
+
+class SnowflakeSessionPool:
+    """
+    A fixed-size pool of Snowflake sessions shared by concurrent batch workers.
+    
+    Each worker checks a session out for the duration of one user and returns it
+    afterwards, so sessions are reused across users instead of being reconnected,
+    and no two workers run on the same session at once. The first session is the
+    regular cached one from connect_to_snowflake; further sessions are only opened
+    when every existing one is busy, up to size. Sessions are opened one at a
+    time, so the first sign-in (an SSO browser prompt with the externalbrowser
+    authenticator) completes and caches its token before any other session
+    authenticates. When a user's work raises, the session is checked with a
+    "SELECT 1" and only closed if that fails too, so an ordinary error (such as
+    an unknown username) doesn't cost a fresh sign-in while a dropped or
+    expired session isn't handed to the next worker.
+    
+    Example:
+        pool = SnowflakeSessionPool(snowflake_config, size=4)
+        try:
+            with pool.session() as session:
+                df = get_data_from_snowflake(query, session=session)
+        finally:
+            pool.close()
+    """
+    
+    def __init__(self, snowflake_config: Optional[Dict] = None, size: int = 1):
+        self.snowflake_config = snowflake_config
+        self.size = max(1, size)
+        self._idle = []
+        self._shared = None  # The cached session from connect_to_snowflake, once opened
+        self._owned = []  # Sessions opened by the pool (closed by close())
+        self._created = 0
+        # Guards the bookkeeping above; waiters are woken when a session is
+        # returned or a slot for a new one frees up
+        self._condition = threading.Condition()
+        # Held while a session is opened, so sessions authenticate one at a time
+        self._create_lock = threading.Lock()
+    
+    def _create_session(self) -> Session:
+        with self._condition:
+            first = self._shared is None
+        if first:
+            # The shared cached session is the first one handed out
+            session = connect_to_snowflake(self.snowflake_config)
+            with self._condition:
+                self._shared = session
+            return session
+        config = _resolve_config(self.snowflake_config)
+        # Stop idle pooled sessions from expiring between users
+        config.setdefault("client_session_keep_alive", True)
+        session = Session.builder.configs(config).create()
+        with self._condition:
+            self._owned.append(session)
+        return session
+    
+    def _checkout(self) -> Session:
+        with self._condition:
+            while not self._idle and self._created >= self.size:
+                self._condition.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            with self._create_lock:
+                return self._create_session()
+        except Exception:
+            with self._condition:
+                self._created -= 1
+                self._condition.notify()
+            raise
+    
+    def _discard(self, session: Session):
+        with self._condition:
+            self._created -= 1
+            if session is self._shared:
+                # connect_to_snowflake notices the closed session and replaces it
+                self._shared = None
+            elif session in self._owned:
+                self._owned.remove(session)
+            self._condition.notify()
+        try:
+            session.close()
+        except Exception:
+            pass
+    
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Check a session out of the pool, blocking while all of them are busy."""
+        session = self._checkout()
+        try:
+            yield session
+        except Exception:
+            if _session_is_alive(session):
+                self._checkin(session)
+            else:
+                self._discard(session)
+            raise
+        except BaseException:
+            # KeyboardInterrupt and the like say nothing about the session
+            self._checkin(session)
+            raise
+        self._checkin(session)
+    
+    def _checkin(self, session: Session):
+        with self._condition:
+            self._idle.append(session)
+            self._condition.notify()
+    
+    def close(self):
+        """Close the sessions this pool opened (the shared cached session is kept)."""
+        with self._condition:
+            owned, self._owned = self._owned, []
+        for session in owned:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+
 def close_all_sessions():
     """
     Close all cached Snowflake sessions.
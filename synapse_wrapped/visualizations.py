@@ -4,14 +4,14 @@ Visualization functions for Synapse Wrapped metrics.
 
 import base64
 import io
+import random
 from collections import Counter
 from typing import Dict, List, Optional
 
-import matplotlib.pyplot as plt
-import networkx as nx
 import pandas as pd
-import plotly.graph_objects as go
-from wordcloud import WordCloud
+
+# Neon palette for dark-mode word clouds (picked per word by the color function)
+NEON_WORDCLOUD_COLORS = ('#00fff7', '#ff00ff', '#00ffaa', '#ff6b6b', '#4ecdc4', '#a855f7', '#22d3ee')
 
 
 def format_bytes(bytes_value: int) -> str:
@@ -67,6 +67,10 @@ def create_wordcloud_image(project_names: List[str], dark_mode: bool = False) ->
     if not project_names:
         return ""
     
+    # Imported here so importing this module doesn't pull in matplotlib/wordcloud
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
+    
     # Remove duplicates, None values, and 'None' strings
     unique_names = list(set([
         str(name).strip() for name in project_names 
@@ -85,14 +89,15 @@ def create_wordcloud_image(project_names: List[str], dark_mode: bool = False) ->
     for name in unique_names:
         # Split on common delimiters and add individual words
         words = str(name).replace('_', ' ').replace('-', ' ').replace('.', ' ').split()
-        for word in words:
-            word_lower = word.lower().strip()
-            # Filter out very short words, numbers, and common stop words
+        # Filter out very short words, numbers, and common stop words; update()
+        # does the counting in C instead of one Python += per word
+        word_freq.update(
+            word_lower for word_lower in (word.lower().strip() for word in words)
             if (len(word_lower) > 2 and 
                 word_lower not in stop_words and 
                 not word_lower.isdigit() and
-                word_lower.isalpha()):
-                word_freq[word_lower] += 1
+                word_lower.isalpha())
+        )
     
     # Generate word cloud from frequency dictionary
     if not word_freq:
@@ -104,9 +109,7 @@ def create_wordcloud_image(project_names: List[str], dark_mode: bool = False) ->
     if dark_mode:
         # Neon cyan/magenta color palette for dark mode
         def neon_color_func(word, font_size, position, orientation, random_state=None, **kwargs):
-            import random
-            colors = ['#00fff7', '#ff00ff', '#00ffaa', '#ff6b6b', '#4ecdc4', '#a855f7', '#22d3ee']
-            return random.choice(colors)
+            return random.choice(NEON_WORDCLOUD_COLORS)
         color_func = neon_color_func
     
     wordcloud = WordCloud(
@@ -204,9 +207,11 @@ def create_creations_card(creations_df: pd.DataFrame) -> str:
             break
     
     if type_col:
-        projects = int(creations_df[creations_df[type_col] == 'project'][count_col].sum()) if len(creations_df[creations_df[type_col] == 'project']) > 0 else 0
-        files = int(creations_df[creations_df[type_col] == 'file'][count_col].sum()) if len(creations_df[creations_df[type_col] == 'file']) > 0 else 0
-        tables = int(creations_df[creations_df[type_col] == 'table'][count_col].sum()) if len(creations_df[creations_df[type_col] == 'table']) > 0 else 0
+        # Sum per node type in one pass instead of filtering the frame per type
+        totals_by_type = creations_df.groupby(type_col)[count_col].sum()
+        projects = int(totals_by_type.get('project', 0))
+        files = int(totals_by_type.get('file', 0))
+        tables = int(totals_by_type.get('table', 0))
     else:
         # If we can't find node_type, just show total
         projects = files = tables = 0
@@ -240,6 +245,10 @@ def create_network_graph(collaboration_df: pd.DataFrame, user_id: int, user_name
         # If no user_id column, can't create network
         return ""
     
+    # Imported here so importing this module doesn't pull in matplotlib/networkx
+    import matplotlib.pyplot as plt
+    import networkx as nx
+    
     # Create network graph
     G = nx.Graph()
     
@@ -260,19 +269,34 @@ def create_network_graph(collaboration_df: pd.DataFrame, user_id: int, user_name
     # Add central user node
     G.add_node(user_id, label=user_name, size=50, color=central_color)
     
-    # Add collaborator nodes and edges
+    # Collect collaborator nodes and edges, then add them in one call each
+    collab_nodes = []
+    collab_edges = []
     top_collaborators = collaboration_df.head(20)  # Limit to top 20 for visualization
-    for _, row in top_collaborators.iterrows():
-        collab_id = row[user_id_col]
-        collab_name = row.get('collaborator_name', f"User {collab_id}")
-        # Use shared_files as the weight (number of overlapping files downloaded)
-        shared_files = row.get('shared_files', row.get('collaboration_score', 0))
-        
+    
+    # Pull whole columns out once rather than boxing each row into a Series
+    collab_ids = top_collaborators[user_id_col].tolist()
+    if 'collaborator_name' in top_collaborators.columns:
+        collab_names = top_collaborators['collaborator_name'].tolist()
+    else:
+        collab_names = [f"User {collab_id}" for collab_id in collab_ids]
+    # Use shared_files as the weight (number of overlapping files downloaded)
+    if 'shared_files' in top_collaborators.columns:
+        shared_counts = top_collaborators['shared_files'].tolist()
+    elif 'collaboration_score' in top_collaborators.columns:
+        shared_counts = top_collaborators['collaboration_score'].tolist()
+    else:
+        shared_counts = [0] * len(collab_ids)
+    
+    for collab_id, collab_name, shared_files in zip(collab_ids, collab_names, shared_counts):
         # Node size based on number of overlapping files
         node_size = min(30 + int(shared_files / 100), 50)  # Scale based on file count
-        G.add_node(collab_id, label=collab_name, size=node_size, color=collab_color)
+        collab_nodes.append((collab_id, {'label': collab_name, 'size': node_size, 'color': collab_color}))
         # Edge weight is the number of overlapping files
-        G.add_edge(user_id, collab_id, weight=int(shared_files))
+        collab_edges.append((user_id, collab_id, {'weight': int(shared_files)}))
+    
+    G.add_nodes_from(collab_nodes)
+    G.add_edges_from(collab_edges)
     
     # Create matplotlib figure
     fig, ax = plt.subplots(figsize=(12, 8))
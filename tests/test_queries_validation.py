@@ -178,6 +178,12 @@ def main():
         TEST_USER_ID, START_DATE, END_DATE
     )
 
+    results['query_user_download_summary'] = validate_query(
+        "query_user_download_summary",
+        query_user_download_summary,
+        TEST_USER_ID, START_DATE, END_DATE, 'America/Chicago'
+    )
+
     results['query_platform_average_file_size'] = validate_query(
         "query_platform_average_file_size",
         query_platform_average_file_size,
@@ -0,0 +1,344 @@
+"""
+Offline tests for the HTML rendering helpers in synapse_wrapped.generator.
+
+Unlike the other scripts in this directory these need no Snowflake access:
+
+    python -m unittest tests/test_rendering.py
+"""
+
+import re
+import unittest
+
+import pandas as pd
+
+from synapse_wrapped.generator import (
+    _heatmap_calendar,
+    _minify_script,
+    _monotone_path,
+    _nice_limit,
+    compile_html_template,
+    generate_badges_html,
+    generate_growth_chart_svg,
+    generate_heatmap_html,
+    get_html_template,
+    minify_css,
+    minify_html,
+    render_html_template,
+    render_html_template_bytes,
+)
+
+
+
+
+
+
+
+
+
+class MinifyScriptTest(unittest.TestCase):
+    def test_minifies_around_single_line_template_literals(self):
+        # The code between two one-line literals spans lines; only literal
+        # contents decide whether the script is left alone
+        script = "    x.attr('t', `a ${b}`)\n        .append('g')\n        .attr('t', `c ${d}`);\n"
+        self.assertEqual(_minify_script(script), "x.attr('t', `a ${b}`)\n.append('g')\n.attr('t', `c ${d}`);\n")
+
+    def test_leaves_scripts_with_multiline_template_literals_unchanged(self):
+        script = "    const s = `line one\n        line two`;\n"
+        self.assertEqual(_minify_script(script), script)
+
+    def test_backticks_in_strings_and_comments_are_not_template_delimiters(self):
+        # Pairing backticks by position alone would read "'; y = " and "; z = "
+        # as the literals here and flatten the real multi-line one
+        for script in (
+            "    x = '`'; y = `a\n    b`; z = `c`;",
+            "    /* ` */ y = `a\n    b`; z = `c`;",
+        ):
+            self.assertEqual(_minify_script(script), script)
+        script = "    // don't `quote` me\n    x = \"`\";\n    y = `a`;\n"
+        self.assertEqual(_minify_script(script), "x = \"`\";\ny = `a`;\n")
+
+    def test_unreadable_scripts_are_left_unchanged(self):
+        # A quote inside a regex literal can't be told from a string opener
+        script = "    const re = /'/;\n    y = `a`;\n"
+        self.assertEqual(_minify_script(script), script)
+
+
+class MinifyScriptLinesTest(unittest.TestCase):
+    def test_drops_indentation_blank_lines_and_comment_lines(self):
+        script = "\n    // setup\n    const a = 1;\n\n    if (a) {\n        go();  // trailing\n    }\n"
+        self.assertEqual(_minify_script(script), "const a = 1;\nif (a) {\ngo();  // trailing\n}\n")
+
+    def test_template_page_script_is_minified(self):
+        self.assertNotIn("\n        ", get_html_template())
+
+
+class MinifyHtmlTest(unittest.TestCase):
+    def test_collapses_markup_and_drops_comments(self):
+        html = "<div>\n    <!-- note -->\n    <p>Hi   there</p>\n</div>\n"
+        self.assertEqual(minify_html(html), "<div> <p>Hi there</p> </div>")
+
+    def test_keeps_raw_text_elements_and_placeholders(self):
+        html = "<pre>  a\n  b</pre>\n<div>  {name}  </div>"
+        self.assertEqual(minify_html(html), "<pre>  a\n  b</pre> <div> {name} </div>")
+
+
+class MinifyCssTest(unittest.TestCase):
+    def test_strips_comments_and_whitespace(self):
+        css = "/* header */\n.card {\n    color: #FFFFFF;\n    margin: 0 auto;\n}\n"
+        self.assertEqual(minify_css(css), ".card{color:#fff;margin:0 auto}")
+
+    def test_keeps_descendant_selectors_and_calc(self):
+        css = ".a .b { width: calc(100% - 2px); }"
+        self.assertEqual(minify_css(css), ".a .b{width:calc(100% - 2px)}")
+
+    def test_only_shortens_equivalent_hex_colors(self):
+        self.assertEqual(minify_css("a { color: #00ff88; }"), "a{color:#0f8}")
+        self.assertEqual(minify_css("a { color: #00ff87; }"), "a{color:#00ff87}")
+
+
+class RenderHtmlTemplateTest(unittest.TestCase):
+    def test_fills_only_supplied_placeholders(self):
+        template = "<p>{greeting}, {name}</p><script>`${width}`</script>"
+        rendered = render_html_template(template, {"greeting": "Hello", "name": "{name}"})
+        self.assertEqual(rendered, "<p>Hello, {name}</p><script>`${width}`</script>")
+
+    def test_template_without_placeholders(self):
+        self.assertEqual(compile_html_template("<p>static</p>", frozenset({"name"})), ("<p>static</p>", ()))
+
+    def test_compiled_template_is_reused(self):
+        names = frozenset({"name"})
+        self.assertIs(compile_html_template("<p>{name}</p>", names), compile_html_template("<p>{name}</p>", names))
+
+
+class RenderHtmlTemplateBytesTest(unittest.TestCase):
+    def test_bytes_match_encoded_text(self):
+        template = "<p>{name} ✓</p>"
+        values = {"name": "Zoë"}
+        self.assertEqual(render_html_template_bytes(template, values), render_html_template(template, values).encode("utf-8"))
+
+
+class HeatmapGroupingTest(unittest.TestCase):
+    def test_cells_are_grouped_under_one_g_per_level(self):
+        activity = pd.DataFrame({
+            "activity_date": ["2024-01-02", "2024-01-03", "2024-01-04", "2024-03-05"],
+            "activity_count": [10, 40, 60, 100],
+        })
+        html = generate_heatmap_html(activity, 2024)
+        groups = re.findall(r'<g class="heatmap-cells([^"]*)">(.*?)</g>', html)
+        cells = {}
+        for level_class, body in groups:
+            for date_str in re.findall(r"<title>(\d{4}-\d{2}-\d{2}):", body):
+                cells[date_str] = level_class
+        self.assertEqual(len(cells), 366)
+        self.assertEqual(cells["2024-01-01"], "")
+        self.assertEqual(cells["2024-01-02"], " level-1")
+        self.assertEqual(cells["2024-01-03"], " level-2")
+        self.assertEqual(cells["2024-01-04"], " level-3")
+        self.assertEqual(cells["2024-03-05"], " level-4")
+        # One group per level within each month's <svg>
+        for month in re.findall(r"<svg[^>]*>(.*?)</svg>", html):
+            classes = re.findall(r'<g class="heatmap-cells([^"]*)">', month)
+            self.assertEqual(len(classes), len(set(classes)))
+        self.assertIn("<title>2024-03-05: 100 activities</title>", html)
+
+
+class HeatmapCalendarTest(unittest.TestCase):
+    def test_one_cell_per_day(self):
+        for year, days in ((2023, 365), (2024, 366)):
+            calendar = _heatmap_calendar(year)
+            self.assertEqual(len(calendar), 12)
+            dates = [cell[0] for _, cells in calendar for cell in cells]
+            self.assertEqual(len(dates), days)
+            self.assertEqual(len(set(dates)), days)
+            self.assertEqual((dates[0], dates[-1]), (f"{year}-01-01", f"{year}-12-31"))
+
+    def test_layout_is_cached_per_year(self):
+        self.assertIs(_heatmap_calendar(2024), _heatmap_calendar(2024))
+
+    def test_inactive_cell_completes_its_rect(self):
+        date_str, rect_open, inactive_cell = _heatmap_calendar(2024)[0][1][0]
+        self.assertEqual(inactive_cell, f"{rect_open}0 activities</title></rect>")
+        self.assertTrue(rect_open.endswith(f"<title>{date_str}: "))
+
+
+class GrowthChartTest(unittest.TestCase):
+    def test_no_chart_without_usable_months(self):
+        self.assertEqual(generate_growth_chart_svg(pd.DataFrame()), "")
+        self.assertEqual(generate_growth_chart_svg(pd.DataFrame({"total_size_bytes": [1]})), "")
+        unparseable = pd.DataFrame({"month": ["not a month", None], "total_size_bytes": [1e9, 2e9]})
+        self.assertEqual(generate_growth_chart_svg(unparseable), "")
+
+    def test_single_month_is_centred(self):
+        # span == 0: the only point sits mid-plot instead of dividing by zero
+        svg = generate_growth_chart_svg(pd.DataFrame({"month": ["2024-03-01"], "total_size_bytes": [1.5e9]}))
+        self.assertIn('<path class="chart-line" d="M335.00,12.50"></path>', svg)
+        self.assertEqual(svg.count('class="chart-dot"'), 1)
+        self.assertIn("<title>Mar: 1.5 GB</title>", svg)
+
+    def test_unparseable_months_are_dropped_with_their_sizes(self):
+        svg = generate_growth_chart_svg(pd.DataFrame({
+            "month": ["2024-01-01", "garbage", "2024-03-01"],
+            "total_size_bytes": [1e9, 5e9, 2e9],
+        }))
+        self.assertEqual(re.findall(r"<title>([^<]*)</title>", svg), ["Jan: 1.0 GB", "Mar: 3.0 GB"])
+        # First and last months span the full plot width
+        self.assertEqual(re.findall(r'cx="([\d.]+)"', svg), ["0.00", "670.00"])
+
+    def test_all_zero_sizes_have_no_value_ticks(self):
+        svg = generate_growth_chart_svg(pd.DataFrame({"month": ["2024-01-01", "2024-02-01"], "total_size_bytes": [0, 0]}))
+        self.assertIn('<g class="chart-grid"></g>', svg)
+        self.assertEqual(re.findall(r'cy="([\d.]+)"', svg), ["200.00", "200.00"])
+
+
+class GrowthChartGeometryTest(unittest.TestCase):
+    def test_nice_limit_rounds_up_to_a_tick(self):
+        self.assertEqual(_nice_limit(123), 130)
+        self.assertEqual(_nice_limit(7.3e9), 8e9)
+        self.assertAlmostEqual(_nice_limit(0.83), 0.9)
+
+    def test_monotone_path(self):
+        self.assertEqual(_monotone_path([(0, 0), (1, 1)]), "M0.00,0.00L1.00,1.00")
+        self.assertEqual(
+            _monotone_path([(0, 0), (1, 1), (2, 2)]),
+            "M0.00,0.00C0.33,0.33,0.67,0.67,1.00,1.00C1.33,1.33,1.67,1.67,2.00,2.00",
+        )
+
+
+# Metrics that earn no badge; each case below changes one group's metrics
+NO_BADGE_METRICS = dict(
+    project_count=0, percentile_rank=100.0, controlled_projects=0, open_projects=0,
+    night_owl_score=0, early_bird_score=0, file_count=0, total_size_gb=0, active_days=0,
+    weekend_score=0, total_creations=0, files_created=0, comparison_ratio=1.0,
+    busiest_day_downloads=0, collaborator_count=0,
+)
+
+# (metrics, expected badge title or None, whether it is special), at and just
+# past each threshold and special_at of every badge group
+BADGE_BOUNDARY_CASES = [
+    ({'project_count': 4}, None, False),
+    ({'project_count': 5}, 'Project Scout', False),
+    ({'project_count': 9}, 'Project Scout', False),
+    ({'project_count': 10}, 'Data Explorer', False),
+    ({'project_count': 49}, 'Data Explorer', False),
+    ({'project_count': 50}, 'Data Explorer', True),
+    ({'percentile_rank': 25.5}, None, False),
+    ({'percentile_rank': 25}, 'Active Researcher', False),
+    ({'percentile_rank': 10.5}, 'Active Researcher', False),
+    ({'percentile_rank': 10}, 'Heavy User', False),
+    ({'percentile_rank': 5.5}, 'Heavy User', False),
+    ({'percentile_rank': 5}, 'Power User', True),
+    ({'controlled_projects': 7, 'open_projects': 3}, 'Sensitive Data Superstar', True),
+    ({'controlled_projects': 69, 'open_projects': 31}, 'Data Guardian', False),
+    ({'controlled_projects': 5, 'open_projects': 5}, 'Data Guardian', False),
+    ({'controlled_projects': 49, 'open_projects': 51}, 'Open Data Evangelist', True),
+    ({'open_projects': 50}, 'Open Data Evangelist', True),
+    ({'open_projects': 49}, 'Open Data Evangelist', False),
+    ({'open_projects': 20}, 'Open Data Evangelist', False),
+    ({'open_projects': 19}, 'Open Science Advocate', False),
+    ({'open_projects': 10}, 'Open Science Advocate', False),
+    ({'open_projects': 9}, None, False),
+    ({'night_owl_score': 29.9}, None, False),
+    ({'night_owl_score': 30}, 'Evening Explorer', False),
+    ({'night_owl_score': 49.9}, 'Evening Explorer', False),
+    ({'night_owl_score': 50}, 'Night Owl', False),
+    ({'night_owl_score': 69.9}, 'Night Owl', False),
+    ({'night_owl_score': 70}, 'Night Owl', True),
+    ({'early_bird_score': 14.9}, None, False),
+    ({'early_bird_score': 15}, 'Morning Person', False),
+    ({'early_bird_score': 24.9}, 'Morning Person', False),
+    ({'early_bird_score': 25}, 'Early Bird', False),
+    ({'early_bird_score': 39.9}, 'Early Bird', False),
+    ({'early_bird_score': 40}, 'Early Bird', True),
+    ({'weekend_score': 24.9}, None, False),
+    ({'weekend_score': 25}, 'Flexible Schedule', False),
+    ({'weekend_score': 39.9}, 'Flexible Schedule', False),
+    ({'weekend_score': 40}, 'Weekend Warrior', False),
+    ({'weekend_score': 49.9}, 'Weekend Warrior', False),
+    ({'weekend_score': 50}, 'Weekend Warrior', True),
+    ({'file_count': 999}, None, False),
+    ({'file_count': 1000}, 'Active Downloader', False),
+    ({'file_count': 4999}, 'Active Downloader', False),
+    ({'file_count': 5000}, 'Data Collector', False),
+    ({'file_count': 9999}, 'Data Collector', False),
+    ({'file_count': 10000}, 'Data Hoarder', False),
+    ({'file_count': 49999}, 'Data Hoarder', False),
+    ({'file_count': 50000}, 'Data Hoarder', True),
+    ({'total_size_gb': 99.9}, None, False),
+    ({'total_size_gb': 100}, 'Data Enthusiast', False),
+    ({'total_size_gb': 499.9}, 'Data Enthusiast', False),
+    ({'total_size_gb': 500}, 'Data Archivist', False),
+    ({'total_size_gb': 999.9}, 'Data Archivist', False),
+    ({'total_size_gb': 1000}, 'Terabyte Titan', False),
+    ({'total_size_gb': 4999.9}, 'Terabyte Titan', False),
+    ({'total_size_gb': 5000}, 'Terabyte Titan', True),
+    ({'active_days': 99}, None, False),
+    ({'active_days': 100}, 'Regular User', False),
+    ({'active_days': 199}, 'Regular User', False),
+    ({'active_days': 200}, 'Consistent Contributor', False),
+    ({'active_days': 299}, 'Consistent Contributor', False),
+    ({'active_days': 300}, 'Daily Dedication', False),
+    ({'active_days': 349}, 'Daily Dedication', False),
+    ({'active_days': 350}, 'Daily Dedication', True),
+    ({'total_creations': 99}, None, False),
+    ({'total_creations': 100}, 'Contributor', False),
+    ({'total_creations': 499}, 'Contributor', False),
+    ({'total_creations': 500}, 'Active Creator', False),
+    ({'total_creations': 999}, 'Active Creator', False),
+    ({'total_creations': 1000}, 'Content Creator', False),
+    ({'total_creations': 4999}, 'Content Creator', False),
+    ({'total_creations': 5000}, 'Content Creator', True),
+    ({'files_created': 999}, None, False),
+    ({'files_created': 1000}, 'File Factory', False),
+    ({'files_created': 4999}, 'File Factory', False),
+    ({'files_created': 5000}, 'File Factory', True),
+    ({'comparison_ratio': 1.99}, None, False),
+    ({'comparison_ratio': 2.0}, 'Big Data Lover', False),
+    ({'comparison_ratio': 2.99}, 'Big Data Lover', False),
+    ({'comparison_ratio': 3.0}, 'Big Data Lover', True),
+    ({'comparison_ratio': 0.51}, None, False),
+    ({'comparison_ratio': 0.5}, 'Lightweight Champion', False),
+    ({'comparison_ratio': 0.31}, 'Lightweight Champion', False),
+    ({'comparison_ratio': 0.3}, 'Lightweight Champion', True),
+    ({'busiest_day_downloads': 499}, None, False),
+    ({'busiest_day_downloads': 500}, 'Intense Day', False),
+    ({'busiest_day_downloads': 999}, 'Intense Day', False),
+    ({'busiest_day_downloads': 1000}, 'Power Session', False),
+    ({'busiest_day_downloads': 4999}, 'Power Session', False),
+    ({'busiest_day_downloads': 5000}, 'Power Session', True),
+    ({'collaborator_count': 4}, None, False),
+    ({'collaborator_count': 5}, 'Network Builder', False),
+    ({'collaborator_count': 9}, 'Network Builder', False),
+    ({'collaborator_count': 10}, 'Team Player', False),
+    ({'collaborator_count': 19}, 'Team Player', False),
+    ({'collaborator_count': 20}, 'Social Butterfly', False),
+    ({'collaborator_count': 49}, 'Social Butterfly', False),
+    ({'collaborator_count': 50}, 'Social Butterfly', True),
+]
+
+
+class BadgesTest(unittest.TestCase):
+    def awarded(self, **metrics):
+        html = generate_badges_html(**{**NO_BADGE_METRICS, **metrics})
+        return re.findall(r'<div class="badge (\w+)">.*?<div class="badge-title">([^<]*)</div>', html, re.S)
+
+    def test_no_badges(self):
+        self.assertIn("Keep exploring", generate_badges_html(**NO_BADGE_METRICS))
+
+    def test_tier_boundaries(self):
+        for metrics, title, special in BADGE_BOUNDARY_CASES:
+            with self.subTest(**metrics):
+                expected = [('special' if special else 'earned', title)] if title else []
+                self.assertEqual(self.awarded(**metrics), expected)
+
+    def test_one_badge_per_group(self):
+        awarded = self.awarded(project_count=60, file_count=60000, active_days=365)
+        self.assertEqual([title for _, title in awarded], ['Data Explorer', 'Data Hoarder', 'Daily Dedication'])
+
+    def test_descriptions_are_formatted(self):
+        html = generate_badges_html(**{**NO_BADGE_METRICS, 'file_count': 12345, 'percentile_rank': 3.4})
+        self.assertIn("Top 3% of all Synapse downloaders", html)
+        self.assertIn("Downloaded 12,345 files", html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Offline tests for SnowflakeSessionPool, using stub sessions in place of Snowflake:
+
+    python -m unittest tests/test_session_pool.py
+"""
+
+import importlib.util
+import unittest
+from unittest import mock
+
+HAS_SNOWPARK = importlib.util.find_spec("snowflake") is not None
+
+if HAS_SNOWPARK:
+    from synapse_wrapped import utils
+
+
+class StubSession:
+    """Stands in for a Snowpark session; alive=False makes every query fail."""
+
+    def __init__(self, alive=True):
+        self.alive = alive
+        self.closed = False
+
+    def sql(self, query, params=None):
+        session = self
+
+        class Result:
+            def collect(self):
+                if not session.alive or session.closed:
+                    raise RuntimeError("session is gone")
+                return [(1,)]
+
+        return Result()
+
+    def close(self):
+        self.closed = True
+
+
+@unittest.skipUnless(HAS_SNOWPARK, "snowflake-snowpark-python is not installed")
+class SessionPoolErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.created = []
+
+        def connect(config):
+            session = StubSession()
+            self.created.append(session)
+            return session
+
+        patcher = mock.patch.object(utils, "connect_to_snowflake", side_effect=connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.pool = utils.SnowflakeSessionPool({"account": "test"}, size=1)
+
+    def test_ordinary_error_returns_session_to_pool(self):
+        with self.assertRaises(ValueError):
+            with self.pool.session() as session:
+                raise ValueError("User 'nobody' not found in Synapse")
+        self.assertFalse(session.closed)
+        with self.pool.session() as again:
+            self.assertIs(again, session)
+        self.assertEqual(len(self.created), 1)
+
+    def test_interrupt_returns_session_to_pool(self):
+        with self.assertRaises(KeyboardInterrupt):
+            with self.pool.session() as session:
+                raise KeyboardInterrupt
+        with self.pool.session() as again:
+            self.assertIs(again, session)
+
+    def test_dead_session_is_closed_and_replaced(self):
+        with self.assertRaises(RuntimeError):
+            with self.pool.session() as session:
+                session.alive = False
+                raise RuntimeError("connection reset")
+        self.assertTrue(session.closed)
+        with self.pool.session() as again:
+            self.assertIsNot(again, session)
+        self.assertEqual(len(self.created), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()